@@ -1,12 +1,36 @@
 from __future__ import annotations
 
+import codecs
 import struct
 
+# Direct C decoder; skips the codec-name lookup that bytes.decode()/str() do per call
+_UTF16BE = codecs.utf_16_be_decode
+
+# Precompiled scalar readers (no per-call format-string lookup)
+_U32 = struct.Struct(">I").unpack_from
+_F32 = struct.Struct(">f").unpack_from
+
+# Frame header: 4-byte ASCII id + u32 payload length
+FRAME_HEADER = struct.Struct(">4sI")
+
+
+def decode_utf16be(raw: bytes | memoryview) -> str:
+    """Decode UTF-16BE bytes (dropping undecodable units) without copying ``raw``."""
+    return _UTF16BE(raw, "ignore", True)[0]
+
 
 class BER:
-    """Big-endian reader with UTF-16LE (length-prefixed) helper."""
+    """
+    Big-endian reader with UTF-16LE (length-prefixed) helper.
+
+    ``data`` may be ``bytes`` or a ``memoryview``; with a memoryview, ``bytes()``
+    returns zero-copy slices of the underlying buffer.
+    """
+
+    # Fixed layout: no per-instance __dict__, cheaper cursor reads/writes
+    __slots__ = ("data", "off", "end")
 
-    def __init__(self, data: bytes, off: int = 0, end: int | None = None) -> None:
+    def __init__(self, data: bytes | memoryview, off: int = 0, end: int | None = None) -> None:
         self.data = data
         self.off = off
         self.end = len(data) if end is None else end
@@ -26,16 +50,16 @@ class BER:
         return v
 
     def u32(self) -> int:
-        v = struct.unpack_from(">I", self.data, self.off)[0]
+        v = _U32(self.data, self.off)[0]
         self.off += 4
         return v
 
     def f32(self) -> float:
-        v = struct.unpack_from(">f", self.data, self.off)[0]
+        v = _F32(self.data, self.off)[0]
         self.off += 4
         return v
 
-    def bytes(self, n: int) -> bytes:
+    def bytes(self, n: int) -> bytes | memoryview:
         b = self.data[self.off : self.off + n]
         self.off += n
         return b
@@ -45,7 +69,7 @@ class BER:
         n = self.u32()
         raw = self.bytes(n * 2)
         # The TSI controller blob is big-endian overall; wchar_t is UTF-16BE here.
-        return raw.decode("utf-16-be", errors="ignore")
+        return decode_utf16be(raw)
 
 
 def read_frame_header(r: BER) -> tuple[str, int, int]:
@@ -56,7 +80,7 @@ def read_frame_header(r: BER) -> tuple[str, int, int]:
       - The 010 template defines Header.Size as *the number of bytes of content that follow*,
         i.e., **payload length**, NOT including the 8-byte header itself.
     """
-    fid = r.bytes(4).decode("ascii", errors="ignore")
+    fid = str(r.bytes(4), "ascii", "ignore")
     size = r.u32()  # payload length in bytes
     # validate bounds (size can be 0 for empty frames)
     if r.tell() + size > r.end:
@@ -3,80 +3,97 @@ from __future__ import annotations
 import argparse
 import csv
 import json
-from dataclasses import asdict, is_dataclass
-from enum import IntEnum
-from typing import Any, Dict, List
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from dataclasses import fields
+from typing import IO, Iterator
 
+from .models import MappingRow
 from .parser import TsiParser
 from .xml import extract_mapping_blob
 
+# CSV header, in MappingRow field order (same keys as MappingRow.to_json_dict)
+_CSV_FIELDS = tuple(f.name for f in fields(MappingRow))
 
-def _coerce_enums(obj: Any) -> Any:
-    """Convert IntEnum (and nested structures) to plain int for stable CSV/JSON."""
-    if isinstance(obj, IntEnum):
-        return int(obj)
-    if is_dataclass(obj):
-        return {k: _coerce_enums(v) for k, v in asdict(obj).items()}
-    if isinstance(obj, dict):
-        return {k: _coerce_enums(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_coerce_enums(v) for v in obj]
-    return obj
+
+@contextmanager
+def _open_output(path: str, newline: str | None = None) -> Iterator[IO[str]]:
+    """
+    Open ``path`` for a dump that may fail part-way (rows are streamed while parsing).
+
+    - new path: written in place and removed again if the block fails
+    - existing regular file: written to a temp file next to it (same mode) and moved
+      into place only if the block succeeds, so the old contents survive a failure
+    - anything else (symlink, FIFO, /dev/stdout, or no temp file possible in a
+      read-only directory): written through directly, as a plain open() would
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        st = None
+
+    if st is None:
+        f = open(path, "w", encoding="utf-8", newline=newline)
+        try:
+            with f:
+                yield f
+        except BaseException:
+            os.unlink(path)
+            raise
+        return
+
+    tmp = None
+    if stat.S_ISREG(st.st_mode):
+        try:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        except OSError:
+            tmp = None
+    if tmp is None:
+        with open(path, "w", encoding="utf-8", newline=newline) as f:
+            yield f
+        return
+
+    try:
+        with open(fd, "w", encoding="utf-8", newline=newline) as f:
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))  # mkstemp creates 0600
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 def _dump_json(rows, path: str) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(_coerce_enums(rows), f, indent=2, ensure_ascii=False)
+    # Stream the array one row at a time; output matches json.dump(list, indent=2)
+    with _open_output(path) as f:
+        f.write("[")
+        first = True
+        for r in rows:
+            obj = json.dumps(r.to_json_dict(), indent=2, ensure_ascii=False)
+            f.write("\n  " if first else ",\n  ")
+            f.write(obj.replace("\n", "\n  "))  # nest one level; strings never hold raw \n
+            first = False
+        f.write("]" if first else "\n]")
 
 
 def _dump_csv(rows, path: str) -> None:
-    # Coerce to primitives first
-    rows_p = [_coerce_enums(r) for r in rows]
-    if rows_p:
-        fieldnames = list(rows_p[0].keys())
-    else:
-        fieldnames = [
-            "device_name",
-            "device_target",
-            "mapping_type",
-            "traktor_control_id",
-            "midi_binding_id",
-            "midi_note",
-            "controller_type",
-            "interaction_mode",
-            "deck_scope",
-            "auto_repeat",
-            "invert",
-            "soft_takeover",
-            "rotary_sensitivity",
-            "rotary_acceleration",
-            "set_value_to",
-            "mod1_id",
-            "mod1_val",
-            "mod2_id",
-            "mod2_val",
-            "led_min_controller",
-            "led_max_controller",
-            "led_min_midi",
-            "led_max_midi",
-            "led_invert",
-            "led_blend",
-            "resolution_raw",
-            "comment",
-        ]
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
+    with _open_output(path, newline="") as f:
+        w = csv.DictWriter(f, fieldnames=_CSV_FIELDS)
         w.writeheader()
-        for r in rows_p:
-            w.writerow(r)
+        for r in rows:
+            w.writerow(r.to_json_dict())
 
 
 def cmd_dump(args: argparse.Namespace) -> None:
     blob = extract_mapping_blob(args.tsi)
-    rows = TsiParser(cast_enums=True).parse(blob)   # enums enabled
+    parser = TsiParser(cast_enums=True)  # enums enabled
+    # Stream rows unless they are needed for both outputs
+    rows = parser.parse(blob) if args.json and args.csv else parser.iter_parse(blob)
     if args.json:
-        _dump_json([asdict(r) for r in rows], args.json)
+        _dump_json(rows, args.json)
     if args.csv:
-        _dump_csv([asdict(r) for r in rows], args.csv)
+        _dump_csv(rows, args.csv)
     if not args.json and not args.csv:
-        print(json.dumps(_coerce_enums([asdict(r) for r in rows]), indent=2, ensure_ascii=False))
+        print(json.dumps([r.to_json_dict() for r in rows], indent=2, ensure_ascii=False))
@@ -1,21 +1,67 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Iterator, List
+from typing import Iterator, List, Tuple
 
-from .beio import BER, read_frame_header
+from .beio import FRAME_HEADER
 
 # Allow 0-9, A-Z, _, a-z
 ASCII_OK = set(range(48, 58)) | set(range(65, 91)) | set(range(95, 96)) | set(range(97, 123))
 
+# Frame ID (same byte class as ASCII_OK); scan_frames validates and resyncs with it in C
+_ID_RE = re.compile(rb"[0-9A-Z_a-z]{4}")
 
-def looks_like_id(b: bytes) -> bool:
-    return len(b) == 4 and all(c in ASCII_OK for c in b)
+
+def looks_like_id(b: bytes | memoryview) -> bool:
+    return _ID_RE.fullmatch(b) is not None
+
+
+def scan_frames(
+    data: bytes | memoryview, start: int, end: int
+) -> Tuple[List[Tuple[str, int, int]], int]:
+    """
+    Scan the frames directly inside [start, end), resyncing over junk.
+
+    Returns (frames, shallow_count) where frames are (id4, payload_start, payload_end)
+    and shallow_count is the number of frames before the first junk byte.
+    """
+    frames: List[Tuple[str, int, int]] = []
+    shallow = -1
+    off = start
+
+    while off + 8 <= end:
+        # One C-level search both validates the ID at `off` and finds the resync point
+        m = _ID_RE.search(data, off, end)
+        if m is None or m.start() != off:
+            if shallow < 0:
+                shallow = len(frames)
+            # resync inside container payloads: jump to the next plausible ID
+            off = m.start() if m else end
+            continue
+
+        fid, size = FRAME_HEADER.unpack_from(data, off)
+        pstart = off + 8
+        pend = pstart + size
+        if pend > end:
+            if shallow < 0:
+                shallow = len(frames)
+            # invalid size (out of bounds); resync
+            off += 1
+            continue
+
+        frames.append((fid.decode("ascii"), pstart, pend))
+        # Jump to the end of this frame to continue with next sibling
+        off = pend
+
+    return frames, len(frames) if shallow < 0 else shallow
 
 
 @dataclass
 class FrameNode:
     """Generic frame node with a shallow child count (for diagnostics/UI)."""
+    __slots__ = ("id4", "start", "end", "children_count")
+
     id4: str
     start: int  # offset where frame header starts (id)
     end: int    # end offset of payload (exclusive)
@@ -24,54 +70,23 @@ class FrameNode:
 
 class FrameWalker:
     """
-    Recursive frame walker. Yields every frame (pre-order) and also reports a
+    Iterative frame walker. Yields every frame (pre-order) and also reports a
     shallow child count on each node for quick diagnostics.
     """
 
-    def walk(self, data: bytes, start: int = 0, end: int | None = None) -> Iterator[FrameNode]:
+    def walk(
+        self, data: bytes | memoryview, start: int = 0, end: int | None = None
+    ) -> Iterator[FrameNode]:
         if end is None:
             end = len(data)
-        r = BER(data, start, end)
-
-        while r.tell() + 8 <= end:
-            head = data[r.tell(): r.tell() + 4]
-            if not looks_like_id(head):
-                # resync inside container payloads when we hit non-frame bytes
-                r.seek(r.tell() + 1)
-                continue
-
-            try:
-                fid, pstart, pend = read_frame_header(r)
-            except Exception:
-                # invalid header; resync
-                r.seek(r.tell() + 1)
-                continue
-
-            # Count shallow children quickly
-            child_count = self._count_children(data, pstart, pend)
-            node = FrameNode(id4=fid, start=pstart - 8, end=pend, children_count=child_count)
-
-            # Yield this frame
-            yield node
-
-            # Recurse into payload to find nested frames (this was missing before)
-            yield from self.walk(data, pstart, pend)
-
-            # Jump to the end of this frame to continue with next sibling
-            r.seek(pend)
-
-    def _count_children(self, data: bytes, start: int, end: int) -> int:
-        """Quick shallow scan to count immediate children; tolerant of junk."""
-        count = 0
-        rr = BER(data, start, end)
-        while rr.tell() + 8 <= end:
-            head = data[rr.tell(): rr.tell() + 4]
-            if not looks_like_id(head):
-                break
-            try:
-                _fid, cstart, cend = read_frame_header(rr)
-            except Exception:
-                break
-            count += 1
-            rr.seek(cend)
-        return count
+
+        # Explicit stack instead of recursion; reversed so pops come out in pre-order
+        stack, _ = scan_frames(data, start, end)
+        stack.reverse()
+        while stack:
+            fid, pstart, pend = stack.pop()
+            # One scan of the payload gives both the children and the shallow count
+            children, child_count = scan_frames(data, pstart, pend)
+            yield FrameNode(id4=fid, start=pstart - 8, end=pend, children_count=child_count)
+            children.reverse()
+            stack.extend(children)
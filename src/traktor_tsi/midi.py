@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
-# e.g. F4, C#3, G-1 (Traktor often uses negative octaves)
-_NOTE_NAME_RE = re.compile(r"^([A-Ga-g])([#b])?(-?\d+)$")
+# Note names look like F4, C#3, G-1 (Traktor often uses negative octaves)
+_NOTE_LETTERS = frozenset("ABCDEFGabcdefg")
 
 # Semitone map relative to C
 _SEMITONE = {
@@ -17,23 +17,37 @@ _SEMITONE = {
     "B": 11,
 }
 
+# Event token (upper-cased) -> canonical event name
+_EVENT_ALIASES = {"NOTE": "NOTE", "CC": "CC", "CONTROL": "CC"}
+
+
 def _note_name_to_number(note_name: str) -> Optional[int]:
     """
     Convert musical note like 'F4', 'C#3', 'G-1' to a MIDI number using C-1 = 0.
     Formula: number = (octave + 1) * 12 + semitone
+
+    Grammar: letter A-G (any case), optional '#' or 'b', then an optionally negative octave.
     """
-    m = _NOTE_NAME_RE.match(note_name)
-    if not m:
+    if not note_name or note_name[0] not in _NOTE_LETTERS:
         return None
-    letter = m.group(1).upper()
-    accidental = m.group(2) or ""
-    octave = int(m.group(3))
-    key = letter + accidental
+    i = 1
+    accidental = ""
+    if i < len(note_name) and note_name[i] in "#b":
+        accidental = note_name[i]
+        i += 1
+    digits = note_name[i + 1:] if note_name[i:i + 1] == "-" else note_name[i:]
+    if not digits.isdecimal():  # also rejects "", spaces, "+", "_" that int() would accept
+        return None
+    octave = int(note_name[i:])
+    key = note_name[0].upper() + accidental
     if key not in _SEMITONE:
         return None
     semitone = _SEMITONE[key]
     return (octave + 1) * 12 + semitone  # C-1 -> 0
 
+
+# A TSI reuses a small set of binding names across many mappings; results are immutable tuples
+@lru_cache(maxsize=4096)
 def parse_binding_name(name: Optional[str]) -> Tuple[Optional[int], Optional[str], Optional[int], Optional[str]]:
     """
     Parses binding strings like:
@@ -57,7 +71,7 @@ def parse_binding_name(name: Optional[str]) -> Tuple[Optional[int], Optional[str
         ch = None
 
     event_raw = parts[1].strip().upper()
-    event = "NOTE" if event_raw == "NOTE" else ("CC" if event_raw in ("CC", "CONTROL") else event_raw)
+    event = _EVENT_ALIASES.get(event_raw, event_raw)
 
     tail = parts[2].strip()
 
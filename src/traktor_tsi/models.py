@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from .enums import (
     ControllerType,
@@ -12,8 +13,11 @@ from .enums import (
     MidiEncoderMode,
 )
 
+# slots=True needs Python 3.10+; on 3.9 rows keep a regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class MappingRow:
     """
     High-level mapping row extracted from the TSI binary frames.
@@ -93,3 +97,54 @@ class MappingRow:
     interaction_mode_raw: Optional[int] = None
     deck_scope_raw: Optional[int] = None
     resolution_dword: Optional[int] = None              # raw DWORD for resolution
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Field-ordered dict of primitives (IntEnum -> int) for CSV/JSON output."""
+        return {
+            "device_name": self.device_name,
+            "device_target": self.device_target,
+            "traktor_control_id": self.traktor_control_id,
+            "midi_binding_id": self.midi_binding_id,
+            "device_name_raw_hex": self.device_name_raw_hex,
+            "mapping_type": None if self.mapping_type is None else int(self.mapping_type),
+            "midi_note": self.midi_note,
+            "midi_note_raw_hex": self.midi_note_raw_hex,
+            "midi_channel": self.midi_channel,
+            "midi_event": self.midi_event,
+            "midi_number": self.midi_number,
+            "midi_note_name": self.midi_note_name,
+            "midi_encoder_mode": (
+                None if self.midi_encoder_mode is None else int(self.midi_encoder_mode)
+            ),
+            "midi_default_velocity": self.midi_default_velocity,
+            "midi_control_id": self.midi_control_id,
+            "controller_type": None if self.controller_type is None else int(self.controller_type),
+            "interaction_mode": (
+                None if self.interaction_mode is None else int(self.interaction_mode)
+            ),
+            "deck_scope": None if self.deck_scope is None else int(self.deck_scope),
+            "auto_repeat": self.auto_repeat,
+            "invert": self.invert,
+            "soft_takeover": self.soft_takeover,
+            "rotary_sensitivity": self.rotary_sensitivity,
+            "rotary_acceleration": self.rotary_acceleration,
+            "set_value_to": self.set_value_to,
+            "mod1_id": self.mod1_id,
+            "mod1_val": self.mod1_val,
+            "mod2_id": self.mod2_id,
+            "mod2_val": self.mod2_val,
+            "led_min_controller": self.led_min_controller,
+            "led_max_controller": self.led_max_controller,
+            "led_min_midi": self.led_min_midi,
+            "led_max_midi": self.led_max_midi,
+            "led_invert": self.led_invert,
+            "led_blend": self.led_blend,
+            "resolution_raw": None if self.resolution_raw is None else int(self.resolution_raw),
+            "comment": self.comment,
+            "comment_raw_hex": self.comment_raw_hex,
+            "mapping_type_raw": self.mapping_type_raw,
+            "controller_type_raw": self.controller_type_raw,
+            "interaction_mode_raw": self.interaction_mode_raw,
+            "deck_scope_raw": self.deck_scope_raw,
+            "resolution_dword": self.resolution_dword,
+        }
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List, Optional, Tuple
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Type
 
-from .beio import BER, read_frame_header
+from .beio import FRAME_HEADER, decode_utf16be
 from .enums import (
     ControllerType,
     InteractionMode,
@@ -16,20 +19,184 @@ from .frames import FrameWalker
 from .midi import parse_binding_name
 from .models import MappingRow
 
+# CMAI head + nested frame header: midi_binding_id, mapping_type, traktor_control_id,
+# then id4 + payload length of the CMAD frame that follows
+_CMAI_HEAD = struct.Struct(">III4sI")
 
-def _to_s32(u: Optional[int]) -> Optional[int]:
-    """Interpret a u32 as signed 32-bit (Traktor often uses 0xFFFFFFFF as -1)."""
-    if u is None:
-        return None
-    return u - 0x100000000 if u > 0x7FFFFFFF else u
+# CMAD fixed head: unknown1, controller_type, interaction_mode, deck_scope,
+# auto_repeat, invert, soft_takeover, rotary_sensitivity, rotary_acceleration,
+# unknown10, unknown11, set_value_to
+_CMAD_HEAD = struct.Struct(">IIIIIIIffIIf")
+
+# CMAD block after the comment: mod1_id, unk15, mod1_val, mod2_id, unk18, mod2_val, unk20
+_CMAD_MODS = struct.Struct(">IIIIIII")
+
+# CMAD body without a comment: fixed head, zero comment length, modifier block
+_CMAD_BODY = struct.Struct(">IIIIIIIffIIfIIIIIIII")
+
+# CMAD LED/resolution tail of OUT mappings: led_min_ctrl, unknown22, led_max_ctrl,
+# led_min_midi, led_max_midi, led_invert, led_blend, unknown29, resolution dword, unknown30
+_LED_TAIL = struct.Struct(">fIfIIIIIII")
+
+# DCBM binding entry head: binding_id, name length (UTF-16 code units)
+_DCBM_HEAD = struct.Struct(">II")
+
+# DCDT fields after the name: unk1, unk2, velocity, encoder_mode (MidiEncoderMode), control_id
+_DCDT_FIELDS = struct.Struct(">IIfII")
+
+# Count prefix of list frames (DDCI/DDCO, DCBM, CMAS) and single-u32 payloads (DDIF)
+_U32_STRUCT = struct.Struct(">I")
+
+# Raw values the mapping decode branches on
+_MAPPING_TYPE_OUT = int(MappingType.OUT)
+_INTERACTION_MODE_DIRECT = int(InteractionMode.DIRECT)
+
+
+def _frame_oob(fid: bytes, size: int) -> ValueError:
+    """The error for a frame whose payload runs past its container (callers raise it)."""
+    fid_s = fid.decode("ascii", errors="ignore")
+    return ValueError(f"Invalid frame size {size} for {fid_s!r} (out of bounds)")
+
+
+def _read_header(data: memoryview, off: int, end: int) -> Tuple[bytes, int, int]:
+    """
+    Read the frame header at ``off`` and return (id4, payload_start, payload_end).
+
+    ``id4`` stays raw bytes (compare against b"DEVI" etc.); the payload must fit before ``end``.
+    """
+    fid, size = FRAME_HEADER.unpack_from(data, off)
+    payload_start = off + 8
+    payload_end = payload_start + size
+    if payload_end > end:
+        raise _frame_oob(fid, size)
+    return fid, payload_start, payload_end
+
+
+def _read_wstr(data: memoryview, off: int, end: int) -> Tuple[str, int, memoryview]:
+    """
+    Read a u32-length-prefixed UTF-16BE string at ``off``.
+
+    Returns (text, offset after the string, raw bytes as a zero-copy slice); callers
+    that keep a hex dump call ``raw.hex()`` themselves. A string running past ``end``
+    is cut at ``end``.
+    """
+    n = _U32_STRUCT.unpack_from(data, off)[0]
+    raw_start = off + 4
+    raw_end = raw_start + 2 * n
+    if raw_end > end:
+        raw_end = max(raw_start, end)
+    raw = data[raw_start:raw_end]
+    return decode_utf16be(raw), raw_end, raw
+
+
+def _unpack_partial(
+    st: struct.Struct, data: memoryview, off: int, end: int
+) -> Tuple[Tuple[Optional[int | float], ...], int]:
+    """
+    Unpack a run of 4-byte fields at ``off`` and return (values, offset after them).
+
+    If fewer than ``st.size`` bytes remain before ``end``, the fields that fit are read
+    and the missing ones come back as None (truncated CMAD frames).
+    """
+    if end - off >= st.size:
+        return st.unpack_from(data, off), off + st.size
+    codes = st.format[1:]
+    n = max(0, (end - off) // 4)
+    values = struct.unpack_from(">" + codes[:n], data, off) + (None,) * (len(codes) - n)
+    return values, off + 4 * n
+
+
+def _decode_cmad(
+    data: memoryview, start: int, end: int
+) -> Tuple[tuple, Optional[str], Optional[str], tuple, int]:
+    """
+    Decode the primitive fields of a CMAD payload in [start, end), up to the LED tail.
+
+    Returns (head, comment, comment_raw_hex, mods, offset after the modifier block), with
+    head/mods laid out as _CMAD_HEAD/_CMAD_MODS and None for fields a truncated frame lacks.
+    """
+    if end - start >= _CMAD_BODY.size:
+        # one bounds check covers the fixed head and the comment length
+        body = _CMAD_BODY.unpack_from(data, start)
+        if not body[12]:  # comment length
+            # no comment: the whole body came out of one read
+            return body[:12], None, None, body[13:], start + _CMAD_BODY.size
+        # a comment shifts the modifier block; the head is already decoded
+        head, off = body[:12], start + _CMAD_HEAD.size
+    else:
+        head, off = _unpack_partial(_CMAD_HEAD, data, start, end)
+        if off + 4 <= end and not _U32_STRUCT.unpack_from(data, off)[0]:
+            # short frame with an empty comment: nothing to decode
+            mods, off = _unpack_partial(_CMAD_MODS, data, off + 4, end)
+            return head, None, None, mods, off
+    comment = comment_raw_hex = None
+    if off + 4 <= end:
+        text, off, raw = _read_wstr(data, off, end)
+        if text:
+            comment = text
+        if len(raw):
+            comment_raw_hex = raw.hex()
+    mods, off = _unpack_partial(_CMAD_MODS, data, off, end)
+    return head, comment, comment_raw_hex, mods, off
+
+
+# raw int -> member, built once per enum the parser casts to
+_ENUM_MAPS: Dict[Type[IntEnum], Dict[int, IntEnum]] = {
+    enum_cls: {int(m): m for m in enum_cls}
+    for enum_cls in (
+        ControllerType,
+        InteractionMode,
+        MappingResolution,
+        MappingTargetDeck,
+        MappingType,
+        MidiEncoderMode,
+    )
+}
+
+
+def _cast(enum_cls: Type[IntEnum], value: Optional[int]) -> Optional[IntEnum]:
+    """Look up the enum member for a raw int; None if missing or not a known value."""
+    return _ENUM_MAPS[enum_cls].get(value)  # None is never a key
+
+
+class _BindingInfo(NamedTuple):
+    """A DCBM binding resolved once: name/raw hex, parsed MIDI fields, DDDC definition."""
+    name: Optional[str]
+    raw_hex: Optional[str]
+    channel: Optional[int]
+    event: Optional[str]
+    number: Optional[int]
+    note_name: Optional[str]
+    velocity: Optional[float]
+    encoder_mode: Optional[MidiEncoderMode]
+    control_id: Optional[int]
+
+
+# Mappings whose binding id has no DCBM entry
+_NO_BINDING = _BindingInfo(None, None, None, None, None, None, None, None, None)
+
+
+# Per-process state for TsiParser(workers=N): (parser, memoryview of the blob)
+_worker_state: Optional[Tuple["TsiParser", memoryview]] = None
+
+
+def _init_device_worker(parser: "TsiParser", blob: bytes) -> None:
+    global _worker_state
+    _worker_state = (parser, memoryview(blob))
+
+
+def _parse_device_worker(span: Tuple[int, int]) -> List[MappingRow]:
+    assert _worker_state is not None
+    parser, mv = _worker_state
+    return list(parser._parse_device(mv, span[0], span[1]))
 
 
 class TsiParser:
     """
     High-level parser for Traktor TSI controller-mapping binary blobs.
 
-    - Recurses through frames to find DEVI anywhere
-    - Handles CMAS/DCBM order in DDCB (two-pass)
+    - Finds DEVI via the DIOM/DEVS headers (full frame scan as a fallback)
+    - Handles CMAS/DCBM order in DDCB (CMAS lists parsed after all bindings are read)
     - Parses DDDC (MIDI definitions) to attach encoder_mode/velocity/control_id
     - Conditionally parses CMAD tails (LED/Resolution for OUT mappings only)
     - Sanitizes denorm floats and non-meaningful set_value_to values
@@ -37,80 +204,125 @@ class TsiParser:
     - Captures raw UTF-16BE bytes (hex) for device_name, DCBM binding, CMAD comment
     """
 
-    def __init__(self, cast_enums: bool = True) -> None:
+    def __init__(self, cast_enums: bool = True, workers: int = 1) -> None:
+        """
+        cast_enums: return IntEnum members instead of raw ints for enum fields.
+        workers:    processes used to parse DEVI frames in parallel; 1 parses in-process.
+                    Processes, not threads: the decode is pure Python and holds the GIL.
+        """
         self._cast_enums = cast_enums
+        self._workers = workers
 
     # ---------- Public API ----------
 
     def parse(self, blob: bytes) -> List[MappingRow]:
-        rows: List[MappingRow] = []
-        walker = FrameWalker()
-        for node in walker.walk(blob):
-            if node.id4 == "DEVI":
-                rows.extend(self._parse_device(blob, node.start + 8, node.end))
-        return rows
+        return list(self.iter_parse(blob))
 
-    # ---------- Internal: devices ----------
+    def iter_parse(self, blob: bytes) -> Iterator[MappingRow]:
+        """Like parse(), but yields rows as they are decoded instead of building one list."""
+        # Wrap once: every reader below slices this view without copying.
+        mv = memoryview(blob)
+        devices = self._find_devices(mv)
+
+        if self._workers > 1 and len(devices) > 1:
+            yield from self._parse_devices_parallel(blob, devices)
+            return
+        for start, end in devices:
+            yield from self._parse_device(mv, start, end)
+
+    # ---------- Internal: locating devices ----------
+
+    def _find_devices(self, data: memoryview) -> List[Tuple[int, int]]:
+        """
+        Return (payload_start, payload_end) of every DEVI frame.
+
+        Follows the known layout DIOM → DEVS { u32 count; DEVI ... } reading frame
+        headers only; if that yields nothing, falls back to a full FrameWalker scan.
+        """
+        spans: List[Tuple[int, int]] = []
+        try:
+            self._collect_devices(data, 0, len(data), spans)
+        except ValueError:
+            spans = []
+        if not spans:
+            # unexpected layout: look for DEVI anywhere
+            spans = [(n.start + 8, n.end) for n in FrameWalker().walk(data) if n.id4 == "DEVI"]
+        return spans
+
+    def _collect_devices(
+        self, data: memoryview, start: int, end: int, spans: List[Tuple[int, int]]
+    ) -> None:
+        off = start
+        while off + 8 <= end:
+            fid, cstart, cend = _read_header(data, off, end)
+            if fid == b"DEVI":
+                spans.append((cstart, cend))
+            elif fid == b"DIOM":
+                self._collect_devices(data, cstart, cend, spans)
+            elif fid == b"DEVS":  # u32 device count, then the DEVI frames
+                self._collect_devices(data, cstart + 4, cend, spans)
+            off = cend
+
+    # ---------- Internal: parallel devices ----------
+
+    def _parse_devices_parallel(
+        self, blob: bytes, devices: List[Tuple[int, int]]
+    ) -> Iterator[MappingRow]:
+        """Parse each DEVI in a worker process; rows come back in device order."""
+        with ProcessPoolExecutor(
+            max_workers=min(self._workers, len(devices)),
+            initializer=_init_device_worker,
+            initargs=(self, bytes(blob)),  # shipped once per worker, not per task
+        ) as ex:
+            for rows in ex.map(_parse_device_worker, devices):
+                yield from rows
 
-    def _parse_device(self, data: bytes, start: int, end: int) -> List[MappingRow]:
-        r = BER(data, start, end)
+    # ---------- Internal: devices ----------
 
+    def _parse_device(self, data: memoryview, start: int, end: int) -> Iterator[MappingRow]:
         # Device name (UTF-16 **BE**, prefixed char count) + capture raw bytes
-        name_len = r.u32()
-        device_name_raw = r.bytes(name_len * 2)
-        device_name = device_name_raw.decode("utf-16-be", errors="ignore")
+        device_name, off, device_name_raw = _read_wstr(data, start, end)
         device_name_raw_hex = device_name_raw.hex()
 
-        rows: List[MappingRow] = []
-        while r.tell() < r.end:
-            fid, cstart, cend = read_frame_header(r)
-            if fid == "DDAT":
-                rows.extend(
-                    self._parse_device_data(
-                        data, cstart, cend, device_name, device_name_raw_hex
-                    )
+        while off < end:
+            fid, cstart, cend = _read_header(data, off, end)
+            if fid == b"DDAT":
+                yield from self._parse_device_data(
+                    data, cstart, cend, device_name, device_name_raw_hex
                 )
-            r.seek(cend)
-
-        return rows
+            off = cend
 
     def _parse_device_data(
-        self, data: bytes, start: int, end: int, device_name: str, device_name_raw_hex: str
-    ) -> List[MappingRow]:
-        r = BER(data, start, end)
+        self, data: memoryview, start: int, end: int, device_name: str, device_name_raw_hex: str
+    ) -> Iterator[MappingRow]:
         device_target = 0  # default
 
         # name -> (velocity, encoder_mode, control_id)
         midi_defs: Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]] = {}
 
-        rows: List[MappingRow] = []
-        while r.tell() < r.end:
-            fid, cstart, cend = read_frame_header(r)
+        off = start
+        while off < end:
+            fid, cstart, cend = _read_header(data, off, end)
 
-            if fid == "DDIF":  # DeviceTargetInfo
-                rr = BER(data, cstart, cend)
-                device_target = rr.u32()
+            if fid == b"DDIF":  # DeviceTargetInfo
+                device_target = _U32_STRUCT.unpack_from(data, cstart)[0]
 
-            elif fid == "DDDC":  # MIDI definitions (In/Out)
+            elif fid == b"DDDC":  # MIDI definitions (In/Out)
                 midi_defs.update(self._parse_midi_definitions(data, cstart, cend))
 
-            elif fid == "DDCB":  # Mappings container
-                rows.extend(
-                    self._parse_mappings_container(
-                        data, cstart, cend,
-                        device_name, device_name_raw_hex,
-                        device_target, midi_defs
-                    )
+            elif fid == b"DDCB":  # Mappings container
+                yield from self._parse_mappings_container(
+                    data, cstart, cend,
+                    device_name, device_name_raw_hex,
+                    device_target, midi_defs
                 )
 
-            r.seek(cend)
-
-        return rows
+            off = cend
 
     # ---------- MIDI definitions (DDDC → DDCI/DDCO with DCDT entries) ----------
 
     def _parse_midi_definitions(
-        self, data: bytes, start: int, end: int
+        self, data: memoryview, start: int, end: int
     ) -> Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]]:
         """
         Returns name -> (velocity, encoder_mode, control_id).
@@ -121,173 +333,144 @@ class TsiParser:
           }
         """
         out: Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]] = {}
-        r = BER(data, start, end)
 
         def _scan_list(list_start: int, list_end: int) -> None:
-            rr = BER(data, list_start, list_end)
-            count = rr.u32()
+            count = _U32_STRUCT.unpack_from(data, list_start)[0]
+            off = list_start + 4
             for _ in range(count):
-                fid2, dstart, dend = read_frame_header(rr)
-                if fid2 != "DCDT":  # MidiDefinition
-                    rr.seek(dend)
+                # frame header read inline: this loop runs once per MIDI definition
+                fid2, size = FRAME_HEADER.unpack_from(data, off)
+                dstart = off + 8
+                dend = dstart + size
+                if dend > list_end:
+                    raise _frame_oob(fid2, size)
+                off = dend
+                if fid2 != b"DCDT":  # MidiDefinition
+                    continue
+                # name (u32 UTF-16 length + text) read in place; the raw bytes are not kept.
+                # Unlike the CMAD comment it is never clipped: the fixed fields must follow
+                # inside this frame, so a record whose name runs past them is skipped rather
+                # than read from the next sibling.
+                name_start = dstart + 4
+                name_end = name_start + 2 * _U32_STRUCT.unpack_from(data, dstart)[0]
+                if name_end + _DCDT_FIELDS.size > dend:
                     continue
-                r2 = BER(data, dstart, dend)
-                nlen = r2.u32()
-                raw = r2.bytes(nlen * 2)
-                name = raw.decode("utf-16-be", errors="ignore")
-                _unk1 = r2.u32()
-                _unk2 = r2.u32()
-                velocity = r2.f32()
-                encoder_mode = r2.u32()  # MidiEncoderMode (int)
-                control_id = r2.u32()
+                name = decode_utf16be(data[name_start:name_end])
+                _unk1, _unk2, velocity, encoder_mode, control_id = _DCDT_FIELDS.unpack_from(
+                    data, name_end
+                )
                 out[name] = (velocity, encoder_mode, control_id)
-                rr.seek(dend)
 
-        while r.tell() < r.end:
-            fid, cstart, cend = read_frame_header(r)
-            if fid in ("DDCI", "DDCO"):
+        off = start
+        while off < end:
+            fid, cstart, cend = _read_header(data, off, end)
+            if fid in (b"DDCI", b"DDCO"):
                 _scan_list(cstart, cend)
-            r.seek(cend)
+            off = cend
 
         return out
 
-    # ---------- Mappings container (two-pass over children) ----------
+    # ---------- Mappings container (DDCB → DCBM bindings, CMAS mappings) ----------
 
     def _parse_mappings_container(
         self,
-        data: bytes,
+        data: memoryview,
         start: int,
         end: int,
         device_name: str,
         device_name_raw_hex: str,
         device_target: int,
         midi_defs: Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]],
-    ) -> List[MappingRow]:
-        # First pass: collect child slices
-        child_slices = []
-        r = BER(data, start, end)
-        while r.tell() < r.end:
-            fid, cstart, cend = read_frame_header(r)
-            child_slices.append((fid, cstart, cend))
-            r.seek(cend)
-
-        # Second pass A: aggregate MIDI bindings (with raw bytes) from all DCBM lists
-        midi_bindings: Dict[int, str] = {}
-        midi_bindings_raw_hex: Dict[int, str] = {}
-        for fid, cstart, cend in child_slices:
-            if fid != "DCBM":
+    ) -> Iterator[MappingRow]:
+        # One pass over the children: aggregate MIDI bindings (resolved once per id) from
+        # all DCBM lists, and remember the CMAS lists for after the bindings are complete
+        binding_info: Dict[int, _BindingInfo] = {}
+        cmas_slices: List[Tuple[int, int]] = []
+        off = start
+        while off < end:
+            fid, cstart, cend = _read_header(data, off, end)
+            off = cend
+            if fid == b"CMAS":
+                cmas_slices.append((cstart, cend))
                 continue
-            rr = BER(data, cstart, cend)
-            count = rr.u32()
+            if fid != b"DCBM":
+                continue
+            count = _U32_STRUCT.unpack_from(data, cstart)[0]
+            boff = cstart + 4
             for _ in range(count):
-                fid2, bstart, bend = read_frame_header(rr)
-                if fid2 != "DCBM":
-                    rr.seek(bend)
-                    continue
-                r2 = BER(data, bstart, bend)
-                binding_id = r2.u32()
-                nlen = r2.u32()
-                raw = r2.bytes(nlen * 2)
-                name = raw.decode("utf-16-be", errors="ignore")
-                midi_bindings[binding_id] = name
-                midi_bindings_raw_hex[binding_id] = raw.hex()
-                rr.seek(bend)
-
-        # Second pass B: parse all CMAS lists (mappings)
-        rows: List[MappingRow] = []
-        for fid, cstart, cend in child_slices:
-            if fid == "CMAS":
-                rows.extend(
-                    self._read_mappings_list(
-                        data, cstart, cend,
-                        device_name, device_name_raw_hex,
-                        device_target, midi_bindings, midi_bindings_raw_hex, midi_defs
+                fid2, bstart, bend = _read_header(data, boff, cend)
+                boff = bend
+                if fid2 == b"DCBM":
+                    # binding id + UTF-16BE name, read in place
+                    binding_id, nlen = _DCBM_HEAD.unpack_from(data, bstart)
+                    raw = data[bstart + 8: bstart + 8 + nlen * 2]
+                    binding_info[binding_id] = self._resolve_binding(
+                        decode_utf16be(raw), raw.hex(), midi_defs
                     )
-                )
-        return rows
+
+        # Then parse all CMAS lists (mappings)
+        for cstart, cend in cmas_slices:
+            yield from self._read_mappings_list(
+                data, cstart, cend,
+                device_name, device_name_raw_hex,
+                device_target, binding_info
+            )
 
     def _read_mappings_list(
         self,
-        data: bytes,
+        data: memoryview,
         start: int,
         end: int,
         device_name: str,
         device_name_raw_hex: str,
         device_target: int,
-        midi_bindings: Dict[int, str],
-        midi_bindings_raw_hex: Dict[int, str],
-        midi_defs: Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]],
-    ) -> List[MappingRow]:
-        r = BER(data, start, end)
-        count = r.u32()
+        binding_info: Dict[int, _BindingInfo],
+    ) -> Iterator[MappingRow]:
+        count = _U32_STRUCT.unpack_from(data, start)[0]
+        off = start + 4
 
-        out: List[MappingRow] = []
         for _ in range(count):
-            fid, mstart, mend = read_frame_header(r)
-            if fid == "CMAI":
-                out.append(
-                    self._read_mapping(
-                        data, mstart, mend,
-                        device_name, device_name_raw_hex,
-                        device_target, midi_bindings, midi_bindings_raw_hex, midi_defs
-                    )
+            fid, mstart, mend = _read_header(data, off, end)
+            off = mend
+            if fid == b"CMAI":
+                yield self._read_mapping(
+                    data, mstart, mend,
+                    device_name, device_name_raw_hex,
+                    device_target, binding_info
                 )
-            r.seek(mend)
-        return out
 
     # ---------- One mapping (CMAI/CMAD) ----------
 
     def _read_mapping(
         self,
-        data: bytes,
+        data: memoryview,
         start: int,
         end: int,
         device_name: str,
         device_name_raw_hex: str,
         device_target: int,
-        midi_bindings: Dict[int, str],
-        midi_bindings_raw_hex: Dict[int, str],
-        midi_defs: Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]],
+        binding_info: Dict[int, _BindingInfo],
     ) -> MappingRow:
-        r = BER(data, start, end)
-
-        midi_binding_id = r.u32()
-        mapping_type_val = r.u32()  # 0 In, 1 Out
-        traktor_control_id = r.u32()
-
-        # CMAD (settings)
-        fid, sstart, send = read_frame_header(r)
-        if fid != "CMAD":
+        # CMAI head and the CMAD (settings) frame header in one read
+        (
+            midi_binding_id,
+            mapping_type_val,  # 0 In, 1 Out
+            traktor_control_id,
+            fid,
+            size,
+        ) = _CMAI_HEAD.unpack_from(data, start)
+        sstart = start + _CMAI_HEAD.size
+        send = sstart + size
+        if send > end:
+            raise _frame_oob(fid, size)
+        binding = binding_info.get(midi_binding_id, _NO_BINDING)
+        if fid != b"CMAD":
             return self._build_row_minimal(
                 device_name, device_name_raw_hex, device_target,
                 mapping_type_val, traktor_control_id,
-                midi_binding_id, midi_bindings.get(midi_binding_id),
-                midi_bindings_raw_hex.get(midi_binding_id),
-                midi_defs
+                midi_binding_id, binding
             )
 
-        sr = BER(data, sstart, send)
-
-        def _u32() -> Optional[int]:
-            return sr.u32() if sr.tell() + 4 <= sr.end else None
-
-        def _f32() -> Optional[float]:
-            return sr.f32() if sr.tell() + 4 <= sr.end else None
-
-        def _wstr_raw() -> Tuple[str, Optional[str]]:
-            """
-            Read a length-prefixed UTF-16BE string and return (text, raw_hex).
-            Safe if truncated.
-            """
-            if sr.tell() + 4 > sr.end:
-                return "", None
-            n = sr.u32()
-            bytelen = n * 2
-            if sr.tell() + bytelen > sr.end:
-                bytelen = max(0, sr.end - sr.tell())
-            raw = sr.bytes(bytelen)
-            return raw.decode("utf-16-be", errors="ignore"), (raw.hex() if bytelen else None)
-
         def _clean_f(v: Optional[float]) -> Optional[float]:
             if v is None:
                 return None
@@ -295,32 +478,27 @@ class TsiParser:
                 return None
             return v
 
-        # ---- CMAD fixed head ----
-        _unknown1 = _u32()
-        controller_type_val = _u32()
-        interaction_mode_val = _u32()
-        deck_scope_u32 = _u32()
-        deck_scope_val = _to_s32(deck_scope_u32)  # treat 0xFFFFFFFF as -1
-
-        auto_repeat = _u32()
-        invert = _u32()
-        soft_takeover = _u32()
-        rotary_sensitivity = _f32()
-        rotary_acceleration = _f32()
-        _unknown10 = _u32()
-        _unknown11 = _u32()
-        set_value_to = _f32()
-        comment, comment_raw_hex = _wstr_raw()
-        if comment == "":
-            comment = None
-
-        mod1_id = _u32()
-        _unk15 = _u32()
-        mod1_val = _u32()
-        mod2_id = _u32()
-        _unk18 = _u32()
-        mod2_val = _u32()
-        _unk20 = _u32()
+        # ---- CMAD fixed head, comment and modifier block ----
+        head, comment, comment_raw_hex, mods, off = _decode_cmad(data, sstart, send)
+        (
+            _unknown1,
+            controller_type_val,
+            interaction_mode_val,
+            deck_scope_u32,
+            auto_repeat,
+            invert,
+            soft_takeover,
+            rotary_sensitivity,
+            rotary_acceleration,
+            _unknown10,
+            _unknown11,
+            set_value_to,
+        ) = head
+        # signed 32-bit view of the deck scope (Traktor uses 0xFFFFFFFF as -1)
+        deck_scope_val = deck_scope_u32
+        if deck_scope_val is not None and deck_scope_val > 0x7FFFFFFF:
+            deck_scope_val -= 0x100000000
+        mod1_id, _unk15, mod1_val, mod2_id, _unk18, mod2_val, _unk20 = mods
 
         # Raw copies for diagnostics / output
         mapping_type_raw = mapping_type_val
@@ -335,26 +513,25 @@ class TsiParser:
         led_invert = led_blend = None
         resolution_raw_val = None
 
-        if mapping_type_val == int(MappingType.OUT):
-            tail_len = send - sr.tell()
-            if tail_len >= 40:
-                tail = BER(data, sr.tell(), send)
-                t_led_min_ctrl = _clean_f(tail.f32())
-                _ = tail.u32()  # unknown22
-                t_led_max_ctrl = _clean_f(tail.f32())
-                t_led_min_midi = tail.u32()
-                t_led_max_midi = tail.u32()
-                t_led_invert = tail.u32()
-                t_led_blend = tail.u32()
-                _ = tail.u32()  # unknown29
-                t_res_dword = tail.u32()
-                _ = tail.u32()  # unknown30
-
-                # accept only if we consumed the whole frame AND MIDI ranges are sane
-                if tail.tell() == tail.end and 0 <= t_led_min_midi <= 127 and 0 <= t_led_max_midi <= 127:
-                    sr.seek(send)  # commit
-                    led_min_ctrl = t_led_min_ctrl
-                    led_max_ctrl = t_led_max_ctrl
+        if mapping_type_val == _MAPPING_TYPE_OUT:
+            if send - off == _LED_TAIL.size:
+                (
+                    t_led_min_ctrl,
+                    _unk22,
+                    t_led_max_ctrl,
+                    t_led_min_midi,
+                    t_led_max_midi,
+                    t_led_invert,
+                    t_led_blend,
+                    _unk29,
+                    t_res_dword,
+                    _unk30,
+                ) = _LED_TAIL.unpack_from(data, off)
+
+                # accept only if the tail fills the whole frame AND MIDI ranges are sane
+                if 0 <= t_led_min_midi <= 127 and 0 <= t_led_max_midi <= 127:
+                    led_min_ctrl = _clean_f(t_led_min_ctrl)
+                    led_max_ctrl = _clean_f(t_led_max_ctrl)
                     led_min_midi = t_led_min_midi
                     led_max_midi = t_led_max_midi
                     led_invert = t_led_invert
@@ -362,58 +539,25 @@ class TsiParser:
                     resolution_raw_val = t_res_dword
                     resolution_dword = t_res_dword
 
-        # set_value_to: only meaningful in DIRECT mode
-        if interaction_mode_val != int(InteractionMode.DIRECT) if interaction_mode_val is not None else True:
-            set_value_to = None
-        else:
+        # set_value_to: only meaningful in DIRECT mode (a missing mode is not DIRECT)
+        if interaction_mode_val == _INTERACTION_MODE_DIRECT:
             set_value_to = _clean_f(set_value_to)
+        else:
+            set_value_to = None
 
         # Cast to enums when requested (IntEnum is still an int)
-        def _cast(enum_cls, value: Optional[int]):
-            if not self._cast_enums or value is None:
-                return value
-            try:
-                return enum_cls(value)
-            except ValueError:
-                return None  # treat invalid as missing
-
-        def _cast_res(dw: Optional[int]) -> Optional[MappingResolution]:
-            if dw is None:
-                return None
-            try:
-                return MappingResolution(dw)
-            except ValueError:
-                return None
-
-        mapping_type = _cast(MappingType, mapping_type_val)
-        controller_type = _cast(ControllerType, controller_type_val)
-        interaction_mode = _cast(InteractionMode, interaction_mode_val)
-        deck_scope = _cast(MappingTargetDeck, deck_scope_val)
-        resolution_enum = _cast_res(resolution_raw_val) if self._cast_enums else resolution_raw_val
-
-        # Enrich from binding name and DDDC (+ raw hex)
-        binding_name = midi_bindings.get(midi_binding_id)
-        binding_raw_hex = midi_bindings_raw_hex.get(midi_binding_id)
-        ch, event, number, note_name = parse_binding_name(binding_name)
-
-        # fallback: compute MIDI number from note name if parser didn't produce one
-        if number is None and note_name:
-            number = self._note_to_number_fallback(note_name)
-
-        vel, enc_mode_raw, ctrl_id = (None, None, None)
-        if binding_name and binding_name in midi_defs:
-            vel, enc_mode_raw, ctrl_id = midi_defs[binding_name]
-
-        # normalize NI sentinel control id
-        if ctrl_id == 0xFFFFFFFF:
-            ctrl_id = -1
-
-        midi_encoder_mode = None
-        if enc_mode_raw is not None:
-            try:
-                midi_encoder_mode = MidiEncoderMode(enc_mode_raw)
-            except ValueError:
-                midi_encoder_mode = None
+        if self._cast_enums:
+            mapping_type = _cast(MappingType, mapping_type_val)
+            controller_type = _cast(ControllerType, controller_type_val)
+            interaction_mode = _cast(InteractionMode, interaction_mode_val)
+            deck_scope = _cast(MappingTargetDeck, deck_scope_val)
+            resolution_enum = _cast(MappingResolution, resolution_raw_val)
+        else:
+            mapping_type = mapping_type_val
+            controller_type = controller_type_val
+            interaction_mode = interaction_mode_val
+            deck_scope = deck_scope_val
+            resolution_enum = resolution_raw_val
 
         return MappingRow(
             device_name=device_name,
@@ -422,15 +566,15 @@ class TsiParser:
             mapping_type=mapping_type,
             traktor_control_id=traktor_control_id,
             midi_binding_id=midi_binding_id,
-            midi_note=binding_name,
-            midi_note_raw_hex=binding_raw_hex,
-            midi_channel=ch,
-            midi_event=event,
-            midi_number=number,
-            midi_note_name=note_name,
-            midi_encoder_mode=midi_encoder_mode,
-            midi_default_velocity=_clean_f(vel),
-            midi_control_id=ctrl_id,
+            midi_note=binding.name,
+            midi_note_raw_hex=binding.raw_hex,
+            midi_channel=binding.channel,
+            midi_event=binding.event,
+            midi_number=binding.number,
+            midi_note_name=binding.note_name,
+            midi_encoder_mode=binding.encoder_mode,
+            midi_default_velocity=_clean_f(binding.velocity),
+            midi_control_id=binding.control_id,
             controller_type=controller_type,
             interaction_mode=interaction_mode,
             deck_scope=deck_scope,
@@ -463,6 +607,28 @@ class TsiParser:
 
     # ---------- Helpers ----------
 
+    def _resolve_binding(
+        self,
+        name: str,
+        raw_hex: str,
+        midi_defs: Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]],
+    ) -> _BindingInfo:
+        """Parse a DCBM binding name and join its DDDC definition (once per binding id)."""
+        ch, event, number, note_name = parse_binding_name(name)
+
+        vel, enc_mode_raw, ctrl_id = (None, None, None)
+        if name and name in midi_defs:
+            vel, enc_mode_raw, ctrl_id = midi_defs[name]
+
+        # normalize NI sentinel control id
+        if ctrl_id == 0xFFFFFFFF:
+            ctrl_id = -1
+
+        return _BindingInfo(
+            name, raw_hex, ch, event, number, note_name,
+            vel, _cast(MidiEncoderMode, enc_mode_raw), ctrl_id,
+        )
+
     def _build_row_minimal(
         self,
         device_name: str,
@@ -471,32 +637,13 @@ class TsiParser:
         mapping_type_val: int,
         traktor_control_id: int,
         midi_binding_id: int,
-        midi_note: Optional[str],
-        midi_note_raw_hex: Optional[str],
-        midi_defs: Dict[str, Tuple[Optional[float], Optional[int], Optional[int]]],
+        binding: _BindingInfo,
     ) -> MappingRow:
-        # Parse binding + defs even for minimal rows
-        ch, event, number, note_name = parse_binding_name(midi_note)
-        if number is None and note_name:
-            number = self._note_to_number_fallback(note_name)
-
-        vel = enc = cid = None
-        if midi_note and midi_note in midi_defs:
-            vel, enc, cid = midi_defs[midi_note]
-        if cid == 0xFFFFFFFF:
-            cid = -1
-
-        midi_encoder_mode = None
-        if enc is not None:
-            try:
-                midi_encoder_mode = MidiEncoderMode(enc)
-            except ValueError:
-                midi_encoder_mode = None
-
-        try:
-            mapping_type = MappingType(mapping_type_val) if self._cast_enums else mapping_type_val
-        except ValueError:
-            mapping_type = None
+        # Binding + defs are attached even for minimal rows
+        if self._cast_enums:
+            mapping_type = _cast(MappingType, mapping_type_val)
+        else:
+            mapping_type = mapping_type_val
 
         return MappingRow(
             device_name=device_name,
@@ -505,32 +652,15 @@ class TsiParser:
             mapping_type=mapping_type,
             traktor_control_id=traktor_control_id,
             midi_binding_id=midi_binding_id,
-            midi_note=midi_note,
-            midi_note_raw_hex=midi_note_raw_hex,
-            midi_channel=ch,
-            midi_event=event,
-            midi_number=number,
-            midi_note_name=note_name,
-            midi_encoder_mode=midi_encoder_mode,
-            midi_default_velocity=vel,
-            midi_control_id=cid,
+            midi_note=binding.name,
+            midi_note_raw_hex=binding.raw_hex,
+            midi_channel=binding.channel,
+            midi_event=binding.event,
+            midi_number=binding.number,
+            midi_note_name=binding.note_name,
+            midi_encoder_mode=binding.encoder_mode,
+            midi_default_velocity=binding.velocity,
+            midi_control_id=binding.control_id,
             # raw enum int we do know here:
             mapping_type_raw=mapping_type_val,
         )
-
-    @staticmethod
-    def _note_to_number_fallback(name: str) -> Optional[int]:
-        """
-        Convert 'C#3' style note names to MIDI number with C-1 = 0.
-        Only used if midi.parse_binding_name couldn't provide a number.
-        """
-        base = {"C":0,"C#":1,"Db":1,"D":2,"D#":3,"Eb":3,"E":4,"F":5,"F#":6,"Gb":6,"G":7,"G#":8,"Ab":8,"A":9,"A#":10,"Bb":10,"B":11}
-        name = name.strip()
-        for k in sorted(base.keys(), key=len, reverse=True):
-            if name.startswith(k):
-                try:
-                    octave = int(name[len(k):])
-                except ValueError:
-                    return None
-                return 12 * (octave + 1) + base[k]
-        return None
@@ -13,10 +13,16 @@ def extract_mapping_blob(tsi_path: str) -> bytes:
     Looks for <Entry Name="DeviceIO.Config.Controller" Type="3" Value="..."/>.
     """
     with open(tsi_path, "rb") as f:
-        text = f.read().decode("utf-8", errors="ignore")
-    root = ET.fromstring(text)
-    for e in root.findall(".//Entry"):
-        if e.attrib.get("Name") == "DeviceIO.Config.Controller":
+        raw = f.read()
+    try:
+        # expat decodes the bytes itself: no str copy of the (multi-MB) document
+        root = ET.fromstring(raw)
+    except ET.ParseError:
+        # e.g. stray invalid UTF-8: retry on a lenient decode
+        root = ET.fromstring(raw.decode("utf-8", errors="ignore"))
+    # iter() walks lazily, so the search stops at the first match
+    for e in root.iter("Entry"):
+        if e is not root and e.attrib.get("Name") == "DeviceIO.Config.Controller":
             b64 = e.attrib.get("Value", "")
             return base64.b64decode(b64)
     raise XmlEntryNotFound("DeviceIO.Config.Controller not found in TSI XML.")
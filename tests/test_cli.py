@@ -0,0 +1,66 @@
+import json
+import stat
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from traktor_tsi.cli import _dump_csv, _dump_json
+from traktor_tsi.models import MappingRow
+from traktor_tsi.parser import TsiParser
+from traktor_tsi.xml import extract_mapping_blob
+
+
+def _rows_then_error(rows):
+    # Like iter_parse() on a TSI whose later device is malformed
+    yield from rows
+    raise ValueError("Invalid frame size 4294967295 for 'DDAT' (out of bounds)")
+
+
+def test_dump_leaves_no_file_when_parsing_fails(tmp_path):
+    sample_tsi = Path(__file__).resolve().parents[1] / "examples" / "sample.tsi"
+    if not sample_tsi.exists():
+        pytest.skip("examples/sample.tsi not present; add a small exported TSI to run this test.")
+    rows = TsiParser().parse(extract_mapping_blob(str(sample_tsi)))[:3]
+
+    for dump, name in ((_dump_json, "out.json"), (_dump_csv, "out.csv")):
+        with pytest.raises(ValueError):
+            dump(_rows_then_error(rows), str(tmp_path / name))
+    # neither the target nor a leftover temp file
+    assert list(tmp_path.iterdir()) == []
+
+    # an existing output survives a failed re-dump untouched
+    out = tmp_path / "out.json"
+    _dump_json(rows, str(out))
+    before = out.read_bytes()
+    with pytest.raises(ValueError):
+        _dump_json(_rows_then_error(rows), str(out))
+    assert out.read_bytes() == before
+    assert list(tmp_path.iterdir()) == [out]
+
+
+def _blank_rows(n):
+    return [MappingRow(**{f.name: None for f in fields(MappingRow)}) for _ in range(n)]
+
+
+def test_dump_to_symlink_writes_through_to_its_target(tmp_path):
+    real = tmp_path / "real.json"
+    real.write_text("old", encoding="utf-8")
+    link = tmp_path / "link.json"
+    link.symlink_to(real)
+
+    _dump_json(_blank_rows(2), str(link))
+
+    assert link.is_symlink()
+    assert len(json.loads(real.read_text(encoding="utf-8"))) == 2
+
+
+def test_dump_keeps_the_mode_of_an_existing_output(tmp_path):
+    out = tmp_path / "out.csv"
+    out.write_text("old", encoding="utf-8")
+    out.chmod(0o600)
+
+    _dump_csv(_blank_rows(1), str(out))
+
+    assert stat.S_IMODE(out.stat().st_mode) == 0o600
+    assert out.read_text(encoding="utf-8").startswith("device_name,")
@@ -0,0 +1,35 @@
+import struct
+
+from traktor_tsi.frames import FrameWalker, scan_frames
+
+
+def _frame(fid: bytes, payload: bytes) -> bytes:
+    return fid + struct.pack(">I", len(payload)) + payload
+
+
+# AAAA frame, junk that cannot start an ID, a header whose size runs past the end,
+# then a valid CCCC frame the scan has to resync onto
+_PAYLOAD = (
+    _frame(b"AAAA", b"x")  # 0..9
+    + b"\x00\x01\x02"  # 9..12
+    + b"BADS"  # 12..20, size 0xFFFF
+    + struct.pack(">I", 0xFFFF)
+    + _frame(b"CCCC", b"yz")  # 20..30
+)
+
+
+def test_scan_frames_resyncs_over_junk_and_out_of_bounds_size():
+    frames, shallow = scan_frames(_PAYLOAD, 0, len(_PAYLOAD))
+    # CCCC header starts at 20: the rejected BADS header resyncs 1 byte on, not past it
+    assert frames == [("AAAA", 8, 9), ("CCCC", 28, 30)]
+    assert shallow == 1  # frames before the first junk byte
+
+
+def test_walker_reports_resynced_frames_and_shallow_child_count():
+    blob = _frame(b"ROOT", _PAYLOAD)
+    nodes = list(FrameWalker().walk(blob))
+    assert [(n.id4, n.start, n.end, n.children_count) for n in nodes] == [
+        ("ROOT", 0, 38, 1),
+        ("AAAA", 8, 17, 0),
+        ("CCCC", 28, 38, 0),
+    ]
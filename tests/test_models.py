@@ -0,0 +1,25 @@
+from dataclasses import astuple, fields
+from enum import IntEnum
+from pathlib import Path
+
+import pytest
+
+from traktor_tsi.models import MappingRow
+from traktor_tsi.parser import TsiParser
+from traktor_tsi.xml import extract_mapping_blob
+
+
+def test_to_json_dict_covers_every_field_in_order():
+    # to_json_dict is written out by hand; a new MappingRow field must be added there too
+    row = MappingRow(**{f.name: None for f in fields(MappingRow)})
+    assert tuple(row.to_json_dict()) == tuple(f.name for f in fields(MappingRow))
+
+
+def test_to_json_dict_matches_row_values_with_plain_ints():
+    sample_tsi = Path(__file__).resolve().parents[1] / "examples" / "sample.tsi"
+    if not sample_tsi.exists():
+        pytest.skip("examples/sample.tsi not present; add a small exported TSI to run this test.")
+    for row in TsiParser(cast_enums=True).parse(extract_mapping_blob(str(sample_tsi))):
+        values = tuple(row.to_json_dict().values())
+        assert values == astuple(row)
+        assert not any(isinstance(v, IntEnum) for v in values)
@@ -0,0 +1,157 @@
+import struct
+
+import pytest
+
+from traktor_tsi.parser import TsiParser
+
+
+def _frame(fid: bytes, payload: bytes) -> bytes:
+    return fid + struct.pack(">I", len(payload)) + payload
+
+
+def _wstr(text: str, n=None) -> bytes:
+    raw = text.encode("utf-16-be")
+    return struct.pack(">I", len(raw) // 2 if n is None else n) + raw
+
+
+def _dddc(*dcdt_payloads: bytes) -> memoryview:
+    entries = b"".join(_frame(b"DCDT", p) for p in dcdt_payloads)
+    ddci = _frame(b"DDCI", struct.pack(">I", len(dcdt_payloads)) + entries)
+    return memoryview(ddci)
+
+
+_DCDT_FIELDS = struct.pack(">IIfII", 0, 0, 0.5, 2, 7)
+
+
+def test_midi_definitions_read_fixed_fields_after_name():
+    data = _dddc(_wstr("Ch01.CC.001") + _DCDT_FIELDS)
+    defs = TsiParser()._parse_midi_definitions(data, 0, len(data))
+    assert defs == {"Ch01.CC.001": (0.5, 2, 7)}
+
+
+def test_midi_definition_name_overrunning_its_frame_is_skipped():
+    # The declared length runs the name into the fixed fields; reading them from the
+    # next sibling would store garbage, so only that record is dropped
+    data = _dddc(_wstr("Ch01.CC.001", n=20) + _DCDT_FIELDS, _wstr("Ch02.CC.002") + _DCDT_FIELDS)
+    defs = TsiParser()._parse_midi_definitions(data, 0, len(data))
+    assert defs == {"Ch02.CC.002": (0.5, 2, 7)}
+
+
+# ---- CMAI/CMAD: tolerant decode of short and odd payloads ----
+
+_HEAD = struct.pack(">IIIIIIIffIIf", 0, 1, 3, 0xFFFFFFFF, 0, 1, 0, 1.5, 0.25, 0, 0, 0.5)
+_MODS = struct.pack(">IIIIIII", 2, 0, 1, 3, 0, 4, 0)
+_TAIL = struct.pack(">fIfIIIIIII", 0.25, 0, 0.75, 10, 100, 1, 0, 0, 2, 0)
+
+_FULL_HEAD = dict(
+    controller_type=1,
+    interaction_mode=3,
+    deck_scope=-1,
+    deck_scope_raw=0xFFFFFFFF,
+    auto_repeat=0,
+    invert=1,
+    soft_takeover=0,
+    rotary_sensitivity=1.5,
+    rotary_acceleration=0.25,
+    set_value_to=0.5,
+)
+_FULL_MODS = dict(mod1_id=2, mod1_val=1, mod2_id=3, mod2_val=4)
+_NO_MODS = dict.fromkeys(_FULL_MODS)
+_NO_LED = dict(
+    led_min_controller=None,
+    led_max_controller=None,
+    led_min_midi=None,
+    led_max_midi=None,
+    led_invert=None,
+    led_blend=None,
+    resolution_raw=None,
+    resolution_dword=None,
+)
+
+
+@pytest.mark.parametrize(
+    "mapping_type, cmad, expected",
+    [
+        pytest.param(
+            0,
+            _HEAD + _wstr("") + _MODS,
+            {**_FULL_HEAD, **_FULL_MODS, "comment": None, "comment_raw_hex": None},
+            id="no-comment",
+        ),
+        pytest.param(
+            0,
+            _HEAD[:30],  # 7 whole fields, then 2 stray bytes
+            dict(
+                controller_type=1,
+                interaction_mode=3,
+                deck_scope=-1,
+                auto_repeat=0,
+                invert=1,
+                soft_takeover=0,
+                rotary_sensitivity=None,
+                rotary_acceleration=None,
+                set_value_to=None,
+                comment=None,
+                comment_raw_hex=None,
+                **_NO_MODS,
+            ),
+            id="truncated-head",
+        ),
+        pytest.param(
+            0,
+            _HEAD + _wstr("") + _MODS[:8],  # short frame, empty comment
+            dict(
+                _FULL_HEAD,
+                comment=None,
+                comment_raw_hex=None,
+                mod1_id=2,
+                mod1_val=None,
+                mod2_id=None,
+                mod2_val=None,
+            ),
+            id="short-frame-empty-comment",
+        ),
+        pytest.param(
+            0,
+            _HEAD + _wstr("Hi") + _MODS,  # comment shifts the modifier block
+            {**_FULL_HEAD, **_FULL_MODS, "comment": "Hi", "comment_raw_hex": "00480069"},
+            id="comment-then-mods",
+        ),
+        pytest.param(
+            0,
+            _HEAD + _wstr("Hi", n=100)[:7],  # length 100, only 3 bytes present
+            {**_FULL_HEAD, **_NO_MODS, "comment": "H", "comment_raw_hex": "004800"},
+            id="oversized-comment-length",
+        ),
+        pytest.param(
+            1,
+            _HEAD + _wstr("") + _MODS + _TAIL,
+            dict(
+                _FULL_HEAD,
+                **_FULL_MODS,
+                led_min_controller=0.25,
+                led_max_controller=0.75,
+                led_min_midi=10,
+                led_max_midi=100,
+                led_invert=1,
+                led_blend=0,
+                resolution_raw=2,
+                resolution_dword=2,
+            ),
+            id="out-tail-40-bytes",
+        ),
+        pytest.param(
+            1,
+            _HEAD + _wstr("") + _MODS + _TAIL + b"\x00",  # tail must fill the frame
+            {**_FULL_HEAD, **_FULL_MODS, **_NO_LED},
+            id="out-tail-41-bytes",
+        ),
+    ],
+)
+def test_read_mapping_decodes_short_and_odd_cmad(mapping_type, cmad, expected):
+    cmai = struct.pack(">III", 5, mapping_type, 77) + _frame(b"CMAD", cmad)
+    # trailing bytes stand in for the next sibling; the decode must not read them
+    data = memoryview(cmai + b"\xaa" * 64)
+    row = TsiParser(cast_enums=False)._read_mapping(data, 0, len(cmai), "dev", "", 0, {})
+    assert (row.mapping_type, row.traktor_control_id, row.midi_binding_id) == (mapping_type, 77, 5)
+    assert {k: getattr(row, k) for k in expected} == expected
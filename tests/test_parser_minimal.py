@@ -1,3 +1,7 @@
+from pathlib import Path
+
+import pytest
+
 from traktor_tsi.parser import TsiParser
 from traktor_tsi.xml import extract_mapping_blob
 
@@ -16,3 +20,12 @@ def test_parse_smoke():
     if rows:
         r = rows[0]
         assert hasattr(r, "traktor_control_id")
+
+
+def test_parse_workers_match_in_process():
+    # Parallel per-DEVI parsing must return the same rows, in the same order
+    sample_tsi = Path(__file__).resolve().parents[1] / "examples" / "sample.tsi"
+    if not sample_tsi.exists():
+        pytest.skip("examples/sample.tsi not present; add a small exported TSI to run this test.")
+    blob = extract_mapping_blob(str(sample_tsi))
+    assert TsiParser(workers=2).parse(blob) == TsiParser().parse(blob)